@@ -1,6 +1,5 @@
 """Adaptive light entity that can be controlled by HomeKit."""
 import logging
-from datetime import datetime
 from typing import Any, Dict, Optional
 
 from homeassistant.components.light import (
@@ -13,6 +12,7 @@ from homeassistant.components.light import (
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .calculator import TimeBasedCalculator
 from .const import DOMAIN
@@ -42,14 +42,21 @@ class AdaptiveLight(LightEntity, RestoreEntity):
         self._is_on = False
         self._brightness = 255
         self._color_temp = 3000
+        self._attrs_cache: Optional[Dict[str, Any]] = None
         
         # Generate unique ID based on target entity
         self._attr_unique_id = f"adaptive_{target_entity_id.replace('.', '_')}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the adaptive light."""
-        return self._name
+        
+        # Static entity attributes
+        self._attr_name = name
+        self._attr_supported_color_modes = {ColorMode.COLOR_TEMP}
+        self._attr_color_mode = ColorMode.COLOR_TEMP
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
+            name=f"Adaptive {name}",
+            manufacturer="Simplified Adaptive Lighting",
+            model="Adaptive Light Controller",
+        )
 
     @property
     def is_on(self) -> bool:
@@ -66,26 +73,6 @@ class AdaptiveLight(LightEntity, RestoreEntity):
         """Return the color temperature of the adaptive light."""
         return self._color_temp if self._is_on else None
 
-    @property
-    def supported_color_modes(self) -> set[ColorMode]:
-        """Return the supported color modes."""
-        return {ColorMode.COLOR_TEMP}
-
-    @property
-    def color_mode(self) -> ColorMode:
-        """Return the current color mode."""
-        return ColorMode.COLOR_TEMP
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for the adaptive light."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._attr_unique_id)},
-            name=f"Adaptive {self._name}",
-            manufacturer="Simplified Adaptive Lighting",
-            model="Adaptive Light Controller",
-        )
-
     async def async_added_to_hass(self) -> None:
         """Handle entity added to Home Assistant."""
         await super().async_added_to_hass()
@@ -101,7 +88,7 @@ class AdaptiveLight(LightEntity, RestoreEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the adaptive light and apply adaptive settings to target."""
         # Calculate adaptive settings for current time
-        now = datetime.now()
+        now = dt_util.utcnow()
         adaptive_brightness = self._calculator.get_brightness_pct(now)
         adaptive_color_temp = self._calculator.get_color_temp_kelvin(now)
         
@@ -110,10 +97,14 @@ class AdaptiveLight(LightEntity, RestoreEntity):
         
         # Apply brightness factor and convert to 0-255 range
         corrected_brightness = int(adaptive_brightness * self._brightness_factor * 255 / 100)
-        corrected_brightness = max(1, min(255, corrected_brightness))
+        corrected_brightness = (
+            1 if corrected_brightness < 1 else 255 if corrected_brightness > 255 else corrected_brightness
+        )
         
         # Ensure color temp is in valid range
-        corrected_color_temp = max(2000, min(6500, corrected_color_temp))
+        corrected_color_temp = (
+            2000 if corrected_color_temp < 2000 else 6500 if corrected_color_temp > 6500 else corrected_color_temp
+        )
         
         # Override with any explicitly provided values
         final_brightness = kwargs.get(ATTR_BRIGHTNESS, corrected_brightness)
@@ -126,12 +117,7 @@ class AdaptiveLight(LightEntity, RestoreEntity):
         self._color_temp = final_color_temp
         
         # Control the target light
-        await self._control_target_light(
-            turn_on=True,
-            brightness=final_brightness,
-            color_temp=final_color_temp,
-            transition=transition
-        )
+        await self._turn_on_target(final_brightness, final_color_temp, transition)
         
         self.async_write_ha_state()
         
@@ -151,57 +137,40 @@ class AdaptiveLight(LightEntity, RestoreEntity):
         transition = kwargs.get(ATTR_TRANSITION, 1)
         
         # Turn off the target light
-        await self._control_target_light(
-            turn_on=False,
-            transition=transition
-        )
+        await self._turn_off_target(transition)
         
         self.async_write_ha_state()
         
         _LOGGER.debug("Turned off adaptive light %s", self._name)
 
-    async def _control_target_light(
-        self,
-        turn_on: bool,
-        brightness: Optional[int] = None,
-        color_temp: Optional[int] = None,
-        transition: Optional[int] = None
-    ) -> None:
-        """Control the target light entity."""
+    async def _turn_on_target(self, brightness: int, color_temp: int, transition: float) -> None:
+        """Turn on the target light entity with the given settings."""
+        service_data = {
+            "entity_id": self._target_entity_id,
+            ATTR_BRIGHTNESS: brightness,
+            ATTR_COLOR_TEMP_KELVIN: color_temp,
+            ATTR_TRANSITION: transition,
+        }
+        
+        try:
+            await self.hass.services.async_call("light", "turn_on", service_data)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to control target light %s: %s",
+                self._target_entity_id,
+                err
+            )
+            raise
+
+    async def _turn_off_target(self, transition: float) -> None:
+        """Turn off the target light entity."""
+        service_data = {
+            "entity_id": self._target_entity_id,
+            ATTR_TRANSITION: transition,
+        }
+        
         try:
-            if turn_on:
-                service_data = {
-                    "entity_id": self._target_entity_id,
-                }
-                
-                if brightness is not None:
-                    service_data[ATTR_BRIGHTNESS] = brightness
-                if color_temp is not None:
-                    service_data[ATTR_COLOR_TEMP_KELVIN] = color_temp
-                if transition is not None:
-                    service_data[ATTR_TRANSITION] = transition
-                
-                await self.hass.services.async_call(
-                    "light",
-                    "turn_on",
-                    service_data,
-                    blocking=True
-                )
-            else:
-                service_data = {
-                    "entity_id": self._target_entity_id,
-                }
-                
-                if transition is not None:
-                    service_data[ATTR_TRANSITION] = transition
-                
-                await self.hass.services.async_call(
-                    "light",
-                    "turn_off",
-                    service_data,
-                    blocking=True
-                )
-                
+            await self.hass.services.async_call("light", "turn_off", service_data)
         except Exception as err:
             _LOGGER.error(
                 "Failed to control target light %s: %s",
@@ -221,6 +190,7 @@ class AdaptiveLight(LightEntity, RestoreEntity):
             self._white_balance_offset = white_balance_offset
         if brightness_factor is not None:
             self._brightness_factor = brightness_factor
+        self._attrs_cache = None
         
         _LOGGER.debug(
             "Updated settings for %s: white_balance_offset=%d, brightness_factor=%.2f",
@@ -232,9 +202,12 @@ class AdaptiveLight(LightEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return extra state attributes."""
-        return {
-            "target_entity_id": self._target_entity_id,
-            "white_balance_offset": self._white_balance_offset,
-            "brightness_factor": self._brightness_factor,
-            "adaptive_mode": "time_based",
-        }
\ No newline at end of file
+        # Only changes through async_update_settings, which clears the cache
+        if self._attrs_cache is None:
+            self._attrs_cache = {
+                "target_entity_id": self._target_entity_id,
+                "white_balance_offset": self._white_balance_offset,
+                "brightness_factor": self._brightness_factor,
+                "adaptive_mode": "time_based",
+            }
+        return self._attrs_cache
\ No newline at end of file
@@ -2,13 +2,28 @@
 from __future__ import annotations
 
 import math
-from datetime import datetime, time, timedelta
+from collections import OrderedDict
+from datetime import date, datetime, time, tzinfo
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.sun import get_astral_location
 from homeassistant.util import dt as dt_util
 
+# Number of days of sun times kept in memory
+_SUN_TIMES_CACHE_SIZE = 7
+
+# Length in seconds of the smooth transition on each side of sunrise and sunset
+_TRANSITION_SECONDS = 30 * 60.0
+_TWO_TRANSITION_SECONDS = 2 * _TRANSITION_SECONDS
+
+# Bound once so the sun curve kernel skips the math module attribute lookups
+_sin = math.sin
+_cos = math.cos
+_PI = math.pi
+_HALF_PI = math.pi * 0.5
+_INV_255 = 1.0 / 255.0
+
 
 class TimeBasedCalculator:
     """Calculates adaptive brightness and color temperature based on time of day."""
@@ -27,7 +42,17 @@ class TimeBasedCalculator:
         self.max_brightness = max_brightness
         self.min_color_temp = min_color_temp
         self.max_color_temp = max_color_temp
+        # The ranges are fixed for the calculator's lifetime, so precompute
+        # the terms of the linear interpolations once
+        self._bri_min_pct = min_brightness * _INV_255
+        self._bri_range_pct = (max_brightness - min_brightness) * _INV_255
+        self._bri_range = max_brightness - min_brightness
+        self._ct_range = max_color_temp - min_color_temp
         self._location_info = None
+        self._observer = None
+        self._sun_times_cache: OrderedDict[
+            tuple[date, tzinfo | None], dict[str, Any]
+        ] = OrderedDict()
     
     def get_brightness_pct(self, dt: datetime | None = None) -> float:
         """Get brightness as percentage (0.0-1.0) based on time of day."""
@@ -37,19 +62,18 @@ class TimeBasedCalculator:
         # Get sun position factor (0.0 = night, 1.0 = noon)
         sun_factor = self._get_sun_position_factor(dt)
         
-        # Apply brightness curve with minimum at night
-        min_pct = self.min_brightness / 255.0
-        max_pct = self.max_brightness / 255.0
-        
-        # Use a smooth curve that provides good contrast between day and night
-        brightness_pct = min_pct + (max_pct - min_pct) * sun_factor
-        
-        return max(min_pct, min(max_pct, brightness_pct))
+        # Apply brightness curve with minimum at night; sun_factor is in
+        # [0, 1] so the result always lies within the configured range
+        return self._bri_min_pct + self._bri_range_pct * sun_factor
     
     def get_brightness_value(self, dt: datetime | None = None) -> int:
         """Get brightness value (1-255) based on time of day."""
-        brightness_pct = self.get_brightness_pct(dt)
-        return int(brightness_pct * 255)
+        if dt is None:
+            dt = dt_util.now()
+        
+        # Scale the brightness range directly instead of via a percentage
+        sun_factor = self._get_sun_position_factor(dt)
+        return int(self.min_brightness + self._bri_range * sun_factor)
     
     def get_color_temp_kelvin(self, dt: datetime | None = None) -> int:
         """Get color temperature in Kelvin based on time of day."""
@@ -59,13 +83,27 @@ class TimeBasedCalculator:
         # Get sun position factor (0.0 = night, 1.0 = noon)
         sun_factor = self._get_sun_position_factor(dt)
         
-        # Invert for color temperature (warm at night, cool during day)
-        temp_factor = sun_factor
+        # Warm at night, cool during day
+        return int(self.min_color_temp + self._ct_range * sun_factor)
+    
+    def get_base_values(self, dt: datetime | None = None) -> tuple[int, int]:
+        """
+        Get base brightness and color temperature from one sun evaluation.
         
-        # Calculate color temperature
-        color_temp = self.min_color_temp + (self.max_color_temp - self.min_color_temp) * temp_factor
+        Args:
+            dt: Datetime to calculate for (defaults to now)
+            
+        Returns:
+            Tuple of brightness (1-255) and color temperature in Kelvin
+        """
+        if dt is None:
+            dt = dt_util.now()
         
-        return int(max(self.min_color_temp, min(self.max_color_temp, color_temp)))
+        sun_factor = self._get_sun_position_factor(dt)
+        return (
+            int(self.min_brightness + self._bri_range * sun_factor),
+            int(self.min_color_temp + self._ct_range * sun_factor),
+        )
     
     def apply_white_balance_correction(
         self, 
@@ -83,7 +121,8 @@ class TimeBasedCalculator:
             Corrected color temperature in Kelvin
         """
         corrected_temp = color_temp + white_balance_offset
-        return int(max(self.min_color_temp, min(self.max_color_temp, corrected_temp)))
+        lo, hi = self.min_color_temp, self.max_color_temp
+        return int(lo if corrected_temp < lo else hi if corrected_temp > hi else corrected_temp)
     
     def apply_brightness_factor(
         self, 
@@ -101,7 +140,7 @@ class TimeBasedCalculator:
             Corrected brightness value (1-255)
         """
         corrected_brightness = int(brightness * brightness_factor)
-        return max(1, min(255, corrected_brightness))
+        return 1 if corrected_brightness < 1 else 255 if corrected_brightness > 255 else corrected_brightness
     
     def get_adaptive_settings(
         self, 
@@ -120,12 +159,8 @@ class TimeBasedCalculator:
         Returns:
             Dictionary with brightness and color_temp_kelvin keys
         """
-        if dt is None:
-            dt = dt_util.now()
-        
-        # Get base values
-        base_brightness = self.get_brightness_value(dt)
-        base_color_temp = self.get_color_temp_kelvin(dt)
+        # Evaluate the sun position once and derive both base values from it
+        base_brightness, base_color_temp = self.get_base_values(dt)
         
         # Apply corrections
         corrected_brightness = self.apply_brightness_factor(base_brightness, brightness_factor)
@@ -140,20 +175,56 @@ class TimeBasedCalculator:
         """Get astral location from Home Assistant."""
         if self._location_info is None:
             self._location_info, _ = get_astral_location(self.hass)
+            # Observer is rebuilt on every attribute access, keep one around
+            self._observer = self._location_info.observer
         return self._location_info
     
-    def _get_sun_times(self, dt: datetime) -> dict[str, datetime]:
-        """Get sun times for the given date."""
-        location = self._get_astral_location()
+    def _get_sun_times(self, dt: datetime) -> dict[str, Any]:
+        """
+        Get sun times for the given local date, cached per date.
+        
+        Besides sunrise, sunset and noon the entry holds the transition
+        window boundaries derived from them as POSIX timestamps, which are
+        fixed for the day.
+        """
+        key = (dt.date(), dt.tzinfo)
+        cache = self._sun_times_cache
+        if (sun_times := cache.get(key)) is not None:
+            cache.move_to_end(key)
+            return sun_times
+        
+        sun_times: dict[str, Any] = self._calculate_sun_times(dt)
+        transition_s = _TRANSITION_SECONDS
+        sunrise_ts = sun_times['sunrise'].timestamp()
+        sunset_ts = sun_times['sunset'].timestamp()
+        sunrise_end_ts = sunrise_ts + transition_s
+        sunset_start_ts = sunset_ts - transition_s
+        sun_times.update(
+            sunrise_start_ts=sunrise_ts - transition_s,
+            sunrise_end_ts=sunrise_end_ts,
+            sunset_start_ts=sunset_start_ts,
+            sunset_end_ts=sunset_ts + transition_s,
+            day_duration_s=sunset_start_ts - sunrise_end_ts,
+            transition_s=transition_s,
+            two_transition_s=_TWO_TRANSITION_SECONDS,
+        )
+        cache[key] = sun_times
+        if len(cache) > _SUN_TIMES_CACHE_SIZE:
+            cache.popitem(last=False)
+        return sun_times
+    
+    def _calculate_sun_times(self, dt: datetime) -> dict[str, datetime]:
+        """Calculate sun times for the given local date."""
+        self._get_astral_location()
         
         try:
             # Get sun times for the date using astral location from HA
             from astral.sun import sun
-            sun_times = sun(location.observer, date=dt.date())
+            sun_times = sun(self._observer, date=dt.date(), tzinfo=dt.tzinfo)
             return {
-                'sunrise': sun_times['sunrise'].replace(tzinfo=dt.tzinfo),
-                'sunset': sun_times['sunset'].replace(tzinfo=dt.tzinfo),
-                'noon': sun_times['noon'].replace(tzinfo=dt.tzinfo),
+                'sunrise': sun_times['sunrise'],
+                'sunset': sun_times['sunset'],
+                'noon': sun_times['noon'],
             }
         except Exception:
             # Fallback to default times if astral calculation fails
@@ -172,37 +243,60 @@ class TimeBasedCalculator:
         Returns:
             float: 0.0 at night, 1.0 at solar noon, smooth transitions at sunrise/sunset
         """
-        sun_times = self._get_sun_times(dt)
-        sunrise = sun_times['sunrise']
-        sunset = sun_times['sunset']
-        noon = sun_times['noon']
-        
-        # Add transition periods for smooth curves
-        transition_duration = timedelta(minutes=30)
-        sunrise_start = sunrise - transition_duration
-        sunrise_end = sunrise + transition_duration
-        sunset_start = sunset - transition_duration
-        sunset_end = sunset + transition_duration
-        
-        if dt < sunrise_start or dt > sunset_end:
-            # Deep night
-            return 0.0
-        elif sunrise_start <= dt < sunrise_end:
-            # Sunrise transition (smooth curve from 0 to peak)
-            progress = (dt - sunrise_start).total_seconds() / (2 * transition_duration.total_seconds())
-            return 0.5 * (1 - math.cos(progress * math.pi))
-        elif sunrise_end <= dt < sunset_start:
-            # Day time - use sine curve peaking at solar noon
-            day_duration = (sunset_start - sunrise_end).total_seconds()
-            if day_duration > 0:
-                day_progress = (dt - sunrise_end).total_seconds() / day_duration
-                # Sine curve from 0.5 to 1.0 and back to 0.5
-                return 0.5 + 0.5 * math.sin((day_progress - 0.5) * math.pi)
-            else:
-                return 1.0
-        elif sunset_start <= dt <= sunset_end:
-            # Sunset transition (smooth curve from peak to 0)
-            progress = (dt - sunset_start).total_seconds() / (2 * transition_duration.total_seconds())
-            return 0.5 * (1 + math.cos(progress * math.pi))
-        
-        return 0.0
\ No newline at end of file
+        # Work in local time so sun times are looked up for the local date;
+        # UTC inputs are converted and naive inputs are treated as local
+        dt = dt_util.as_local(dt)
+        return _sun_factor_at(dt.timestamp(), self._get_sun_times(dt))
+
+
+def _sun_factor_at(ts: float, sun_times: dict[str, Any]) -> float:
+    """Calculate the sun position factor for a timestamp on a cached date."""
+    return _sun_factor_kernel(
+        ts,
+        sun_times['sunrise_start_ts'],
+        sun_times['sunrise_end_ts'],
+        sun_times['sunset_start_ts'],
+        sun_times['sunset_end_ts'],
+        sun_times['day_duration_s'],
+        sun_times['two_transition_s'],
+    )
+
+
+def _sun_factor_kernel(
+    ts: float,
+    sunrise_start: float,
+    sunrise_end: float,
+    sunset_start: float,
+    sunset_end: float,
+    day_duration: float,
+    two_transition_s: float,
+) -> float:
+    """
+    Calculate the sun position factor from plain float timestamps.
+    
+    Returns:
+        float: 0.0 at night, 1.0 at solar noon, smooth transitions at sunrise/sunset
+    """
+    if ts < sunrise_start or ts > sunset_end:
+        # Deep night
+        return 0.0
+    elif ts < sunrise_end:
+        # Sunrise transition (smooth curve from 0 to peak)
+        # (1 - cos(pi * p)) / 2 == sin(pi * p / 2) ** 2
+        progress = (ts - sunrise_start) / two_transition_s
+        s = _sin(progress * _HALF_PI)
+        return s * s
+    elif ts < sunset_start:
+        # Day time - use sine curve peaking at solar noon
+        if day_duration > 0:
+            day_progress = (ts - sunrise_end) / day_duration
+            # Sine curve from 0.5 to 1.0 and back to 0.5
+            return 0.5 + 0.5 * _sin((day_progress - 0.5) * _PI)
+        else:
+            return 1.0
+    else:
+        # Sunset transition (smooth curve from peak to 0)
+        # (1 + cos(pi * p)) / 2 == cos(pi * p / 2) ** 2
+        progress = (ts - sunset_start) / two_transition_s
+        c = _cos(progress * _HALF_PI)
+        return c * c
\ No newline at end of file
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 import voluptuous as vol
@@ -30,16 +32,101 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Color modes that allow the brightness of a light to be controlled
+_BRIGHTNESS_MODES: frozenset[str] = frozenset(
+    {"brightness", "color_temp", "hs", "rgb", "rgbw", "rgbww", "white", "xy"}
+)
+
+# Validators shared by every form
+_RANGE_BRIGHTNESS = vol.Range(min=1, max=255)
+_RANGE_COLOR_TEMP = vol.Range(min=1000, max=10000)
+_RANGE_WHITE_BALANCE = vol.Range(min=-1000, max=1000)
+_RANGE_BRIGHTNESS_FACTOR = vol.Range(min=0.1, max=2.0)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_NAME, default="Adaptive Lighting"): str,
+    vol.Optional(CONF_MIN_BRIGHTNESS, default=DEFAULT_MIN_BRIGHTNESS): _RANGE_BRIGHTNESS,
+    vol.Optional(CONF_MAX_BRIGHTNESS, default=DEFAULT_MAX_BRIGHTNESS): _RANGE_BRIGHTNESS,
+    vol.Optional(CONF_MIN_COLOR_TEMP, default=DEFAULT_MIN_COLOR_TEMP): _RANGE_COLOR_TEMP,
+    vol.Optional(CONF_MAX_COLOR_TEMP, default=DEFAULT_MAX_COLOR_TEMP): _RANGE_COLOR_TEMP,
+})
+
+_MAIN_OPTIONS_SCHEMA = vol.Schema({
+    vol.Required("action"): vol.In({
+        "configure_light": "Configure Individual Light White Balance",
+        "add_lights": "Add New Lights",
+        "remove_lights": "Remove Lights", 
+        "global_settings": "Global Settings"
+    }),
+})
+
+# (key, default, validator) for each field of the global settings form
+_GLOBAL_SETTINGS_FIELDS = (
+    (CONF_MIN_BRIGHTNESS, DEFAULT_MIN_BRIGHTNESS, _RANGE_BRIGHTNESS),
+    (CONF_MAX_BRIGHTNESS, DEFAULT_MAX_BRIGHTNESS, _RANGE_BRIGHTNESS),
+    (CONF_MIN_COLOR_TEMP, DEFAULT_MIN_COLOR_TEMP, _RANGE_COLOR_TEMP),
+    (CONF_MAX_COLOR_TEMP, DEFAULT_MAX_COLOR_TEMP, _RANGE_COLOR_TEMP),
+)
+
+
+def _friendly_name(hass: HomeAssistant, entity_id: str) -> str:
+    """Get friendly name for an entity."""
+    state = hass.states.get(entity_id)
+    if state and (name := state.attributes.get("friendly_name")):
+        return name
+    return entity_id.removeprefix("light.").replace("_", " ").title()
+
+
+@lru_cache(maxsize=32)
+def _lights_schema(
+    options: tuple[tuple[str, str], ...], required: bool = True
+) -> vol.Schema:
+    """Build a light multi-select schema, reused while the options are unchanged."""
+    marker = vol.Required if required else vol.Optional
+    return vol.Schema({
+        marker("lights"): cv.multi_select(dict(options)),
+    })
+
+
+def _light_form_keys(entity_id: str) -> tuple[str, str, str, str, str]:
+    """Get an entity ID and its per-light configuration form keys."""
+    return (
+        entity_id,
+        f"{entity_id}_min_color_temp",
+        f"{entity_id}_max_color_temp",
+        f"{entity_id}_white_balance",
+        f"{entity_id}_brightness_factor",
+    )
+
+
+@lru_cache(maxsize=16)
+def _configure_lights_schema(
+    light_keys: tuple[tuple[str, str, str, str, str], ...]
+) -> vol.Schema:
+    """Build the per-light configuration schema for the selected lights."""
+    schema_dict = {}
+    
+    for _, min_key, max_key, wb_key, bf_key in light_keys:
+        # Add per-light color temperature range configuration
+        schema_dict[vol.Optional(min_key, default=DEFAULT_MIN_COLOR_TEMP)] = _RANGE_COLOR_TEMP
+        schema_dict[vol.Optional(max_key, default=DEFAULT_MAX_COLOR_TEMP)] = _RANGE_COLOR_TEMP
+        schema_dict[vol.Optional(wb_key, default=DEFAULT_WHITE_BALANCE_OFFSET)] = _RANGE_WHITE_BALANCE
+        schema_dict[vol.Optional(bf_key, default=DEFAULT_BRIGHTNESS_FACTOR)] = _RANGE_BRIGHTNESS_FACTOR
+    
+    return vol.Schema(schema_dict)
+
 
 class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Simplified Adaptive Lighting."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._config: dict[str, Any] = {}
         self._selected_lights: list[str] = []
+        self._light_keys: tuple[tuple[str, str, str, str, str], ...] = ()
+        self._light_entities_cache: dict[str, str] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -60,17 +147,9 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
             return await self.async_step_select_lights()
 
         # Show the initial configuration form
-        data_schema = vol.Schema({
-            vol.Required(CONF_NAME, default="Adaptive Lighting"): str,
-            vol.Optional(CONF_MIN_BRIGHTNESS, default=DEFAULT_MIN_BRIGHTNESS): vol.Range(min=1, max=255),
-            vol.Optional(CONF_MAX_BRIGHTNESS, default=DEFAULT_MAX_BRIGHTNESS): vol.Range(min=1, max=255),
-            vol.Optional(CONF_MIN_COLOR_TEMP, default=DEFAULT_MIN_COLOR_TEMP): vol.Range(min=1000, max=10000),
-            vol.Optional(CONF_MAX_COLOR_TEMP, default=DEFAULT_MAX_COLOR_TEMP): vol.Range(min=1000, max=10000),
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -87,6 +166,10 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
                 errors["lights"] = "no_lights_selected"
             else:
                 self._selected_lights = selected_lights
+                self._light_entities_cache = None
+                self._light_keys = tuple(
+                    _light_form_keys(entity_id) for entity_id in selected_lights
+                )
                 return await self.async_step_configure_lights()
 
         # Get available light entities
@@ -95,9 +178,7 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
         if not light_entities:
             return self.async_abort(reason="no_lights_available")
 
-        data_schema = vol.Schema({
-            vol.Required("lights"): cv.multi_select(light_entities),
-        })
+        data_schema = _lights_schema(tuple(light_entities.items()))
 
         return self.async_show_form(
             step_id="select_lights",
@@ -111,17 +192,15 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
         """Handle per-light configuration step."""
         if user_input is not None:
             # Process light configurations
-            lights_config = []
-            
-            for entity_id in self._selected_lights:
-                light_config = {
-                    "entity_id": entity_id,
-                    "min_color_temp": user_input.get(f"{entity_id}_min_color_temp", DEFAULT_MIN_COLOR_TEMP),
-                    "max_color_temp": user_input.get(f"{entity_id}_max_color_temp", DEFAULT_MAX_COLOR_TEMP),
-                    CONF_WHITE_BALANCE_OFFSET: user_input.get(f"{entity_id}_white_balance", DEFAULT_WHITE_BALANCE_OFFSET),
-                    CONF_BRIGHTNESS_FACTOR: user_input.get(f"{entity_id}_brightness_factor", DEFAULT_BRIGHTNESS_FACTOR),
+            lights_config = {
+                entity_id: {
+                    "min_color_temp": user_input.get(min_key, DEFAULT_MIN_COLOR_TEMP),
+                    "max_color_temp": user_input.get(max_key, DEFAULT_MAX_COLOR_TEMP),
+                    CONF_WHITE_BALANCE_OFFSET: user_input.get(wb_key, DEFAULT_WHITE_BALANCE_OFFSET),
+                    CONF_BRIGHTNESS_FACTOR: user_input.get(bf_key, DEFAULT_BRIGHTNESS_FACTOR),
                 }
-                lights_config.append(light_config)
+                for entity_id, min_key, max_key, wb_key, bf_key in self._light_keys
+            }
             
             # Combine all configuration
             final_config = {
@@ -135,48 +214,32 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
             )
 
         # Create schema for per-light configuration
-        schema_dict = {}
-        
-        for entity_id in self._selected_lights:
-            entity_name = self._get_entity_name(entity_id)
-            # Add per-light color temperature range configuration
-            schema_dict[vol.Optional(f"{entity_id}_min_color_temp", default=DEFAULT_MIN_COLOR_TEMP)] = vol.Range(min=1000, max=10000)
-            schema_dict[vol.Optional(f"{entity_id}_max_color_temp", default=DEFAULT_MAX_COLOR_TEMP)] = vol.Range(min=1000, max=10000)
-            schema_dict[vol.Optional(f"{entity_id}_white_balance", default=DEFAULT_WHITE_BALANCE_OFFSET)] = vol.Range(min=-1000, max=1000)
-            schema_dict[vol.Optional(f"{entity_id}_brightness_factor", default=DEFAULT_BRIGHTNESS_FACTOR)] = vol.Range(min=0.1, max=2.0)
-
-        data_schema = vol.Schema(schema_dict)
-
         return self.async_show_form(
             step_id="configure_lights",
-            data_schema=data_schema,
+            data_schema=_configure_lights_schema(self._light_keys),
         )
 
     def _get_light_entities(self) -> dict[str, str]:
-        """Get available light entities."""
+        """Get available light entities, cached while the form is re-rendered."""
+        if self._light_entities_cache is not None:
+            return self._light_entities_cache
+        
         light_entities = {}
         
-        # Get all light entities from the registry
-        for entity in self.hass.states.async_all():
+        # Only walk the states of the light domain
+        for entity in self.hass.states.async_all("light"):
             entity_id = entity.entity_id
-            if entity_id.startswith("light.") and entity.state != "unavailable":
-                # Check if the light supports color modes we care about
+            if entity.state != "unavailable":
+                # Check if the light supports a brightness capable color mode
                 attributes = entity.attributes
-                supported_color_modes = attributes.get("supported_color_modes", [])
-                if supported_color_modes:
-                    # Accept any light with color modes - they all support brightness
+                supported_color_modes = attributes.get("supported_color_modes") or ()
+                if not _BRIGHTNESS_MODES.isdisjoint(supported_color_modes):
                     friendly_name = attributes.get("friendly_name", entity_id)
                     light_entities[entity_id] = friendly_name
         
+        self._light_entities_cache = light_entities
         return light_entities
 
-    def _get_entity_name(self, entity_id: str) -> str:
-        """Get friendly name for an entity."""
-        state = self.hass.states.get(entity_id)
-        if state and state.attributes.get("friendly_name"):
-            return state.attributes["friendly_name"]
-        return entity_id.replace("light.", "").replace("_", " ").title()
-
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> OptionsFlow:
@@ -186,10 +249,19 @@ class SimplifiedAdaptiveLightingConfigFlow(config_entries.ConfigFlow, domain=DOM
 class OptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Simplified Adaptive Lighting."""
 
+    # Step method for each main options action
+    _MENU_ACTIONS: dict[str, str] = {
+        "configure_light": "async_step_select_light_to_configure",
+        "add_lights": "async_step_add_lights",
+        "remove_lights": "async_step_remove_lights",
+        "global_settings": "async_step_global_settings",
+    }
+
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
         self._selected_light: str | None = None
+        self._friendly_names_cache: dict[str, str] | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -202,45 +274,27 @@ class OptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Show main options form."""
         if user_input is not None:
-            action = user_input.get("action")
-            if action == "configure_light":
-                return await self.async_step_select_light_to_configure()
-            elif action == "add_lights":
-                return await self.async_step_add_lights()
-            elif action == "remove_lights":
-                return await self.async_step_remove_lights()
-            elif action == "global_settings":
-                return await self.async_step_global_settings()
+            step = self._MENU_ACTIONS.get(user_input.get("action"))
+            if step is not None:
+                return await getattr(self, step)()
 
         # Get current configuration info
-        lights_config = self.config_entry.data.get(CONF_LIGHTS, [])
+        lights_config = self.config_entry.data.get(CONF_LIGHTS, {})
         configured_count = len(lights_config)
         
         # Create a simple description of configured lights
         if configured_count == 0:
             lights_description = "No lights configured"
         elif configured_count <= 3:
-            light_names = [self._get_entity_name(light["entity_id"]) for light in lights_config]
+            light_names = [self._get_entity_name(entity_id) for entity_id in lights_config]
             lights_description = ", ".join(light_names)
         else:
-            light_names = [self._get_entity_name(light["entity_id"]) for light in lights_config[:3]]
+            light_names = [self._get_entity_name(entity_id) for entity_id in islice(lights_config, 3)]
             lights_description = ", ".join(light_names) + f" and {configured_count - 3} more"
 
-        # Create action options
-        action_options = {
-            "configure_light": "Configure Individual Light White Balance",
-            "add_lights": "Add New Lights",
-            "remove_lights": "Remove Lights", 
-            "global_settings": "Global Settings"
-        }
-
-        data_schema = vol.Schema({
-            vol.Required("action"): vol.In(action_options),
-        })
-
         return self.async_show_form(
             step_id="main_options",
-            data_schema=data_schema,
+            data_schema=_MAIN_OPTIONS_SCHEMA,
             description_placeholders={
                 "configured_count": str(configured_count),
                 "configured_lights": lights_description
@@ -256,16 +310,14 @@ class OptionsFlow(config_entries.OptionsFlow):
             return await self.async_step_configure_selected_light()
 
         # Get currently configured lights
-        lights_config = self.config_entry.data.get(CONF_LIGHTS, [])
+        lights_config = self.config_entry.data.get(CONF_LIGHTS, {})
         if not lights_config:
             return self.async_abort(reason="no_lights_configured")
 
         # Create options for configured lights
-        light_options = {}
-        for light_config in lights_config:
-            entity_id = light_config["entity_id"]
-            friendly_name = self._get_entity_name(entity_id)
-            light_options[entity_id] = friendly_name
+        light_options = {
+            entity_id: self._get_entity_name(entity_id) for entity_id in lights_config
+        }
 
         data_schema = vol.Schema({
             vol.Required("light"): vol.In(light_options),
@@ -283,30 +335,23 @@ class OptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             # Update the configuration for the selected light
             new_data = dict(self.config_entry.data)
-            lights_config = list(new_data.get(CONF_LIGHTS, []))
+            lights_config = dict(new_data.get(CONF_LIGHTS, {}))
             
-            # Find and update the light configuration
-            for i, light_config in enumerate(lights_config):
-                if light_config["entity_id"] == self._selected_light:
-                    lights_config[i] = {
-                        "entity_id": self._selected_light,
-                        "min_color_temp": user_input["min_color_temp"],
-                        "max_color_temp": user_input["max_color_temp"],
-                        CONF_WHITE_BALANCE_OFFSET: user_input["white_balance_offset"],
-                        CONF_BRIGHTNESS_FACTOR: user_input["brightness_factor"],
-                    }
-                    break
+            # Update the light configuration
+            if self._selected_light in lights_config:
+                lights_config[self._selected_light] = {
+                    "min_color_temp": user_input["min_color_temp"],
+                    "max_color_temp": user_input["max_color_temp"],
+                    CONF_WHITE_BALANCE_OFFSET: user_input["white_balance_offset"],
+                    CONF_BRIGHTNESS_FACTOR: user_input["brightness_factor"],
+                }
             
             new_data[CONF_LIGHTS] = lights_config
             
             return self.async_create_entry(title="", data=new_data)
 
         # Get current configuration for the selected light
-        current_config = None
-        for light_config in self.config_entry.data.get(CONF_LIGHTS, []):
-            if light_config["entity_id"] == self._selected_light:
-                current_config = light_config
-                break
+        current_config = self.config_entry.data.get(CONF_LIGHTS, {}).get(self._selected_light)
 
         if not current_config:
             return self.async_abort(reason="light_not_found")
@@ -317,19 +362,19 @@ class OptionsFlow(config_entries.OptionsFlow):
             vol.Required(
                 "min_color_temp", 
                 default=current_config.get("min_color_temp", DEFAULT_MIN_COLOR_TEMP)
-            ): vol.Range(min=1000, max=10000),
+            ): _RANGE_COLOR_TEMP,
             vol.Required(
                 "max_color_temp", 
                 default=current_config.get("max_color_temp", DEFAULT_MAX_COLOR_TEMP)
-            ): vol.Range(min=1000, max=10000),
+            ): _RANGE_COLOR_TEMP,
             vol.Required(
                 "white_balance_offset", 
                 default=current_config.get(CONF_WHITE_BALANCE_OFFSET, DEFAULT_WHITE_BALANCE_OFFSET)
-            ): vol.Range(min=-1000, max=1000),
+            ): _RANGE_WHITE_BALANCE,
             vol.Required(
                 "brightness_factor", 
                 default=current_config.get(CONF_BRIGHTNESS_FACTOR, DEFAULT_BRIGHTNESS_FACTOR)
-            ): vol.Range(min=0.1, max=2.0),
+            ): _RANGE_BRIGHTNESS_FACTOR,
         })
 
         return self.async_show_form(
@@ -354,20 +399,19 @@ class OptionsFlow(config_entries.OptionsFlow):
             
             # Add new lights with default configuration
             new_data = dict(self.config_entry.data)
-            lights_config = list(new_data.get(CONF_LIGHTS, []))
+            lights_config = dict(new_data.get(CONF_LIGHTS, {}))
             
             for entity_id in selected_lights:
                 # Check if light is already configured
-                if any(light["entity_id"] == entity_id for light in lights_config):
+                if entity_id in lights_config:
                     continue
                     
-                lights_config.append({
-                    "entity_id": entity_id,
+                lights_config[entity_id] = {
                     "min_color_temp": DEFAULT_MIN_COLOR_TEMP,
                     "max_color_temp": DEFAULT_MAX_COLOR_TEMP,
                     CONF_WHITE_BALANCE_OFFSET: DEFAULT_WHITE_BALANCE_OFFSET,
                     CONF_BRIGHTNESS_FACTOR: DEFAULT_BRIGHTNESS_FACTOR,
-                })
+                }
             
             new_data[CONF_LIGHTS] = lights_config
             
@@ -383,15 +427,16 @@ class OptionsFlow(config_entries.OptionsFlow):
     ) -> FlowResult:
         """Remove lights from the configuration."""
         if user_input is not None:
-            lights_to_remove = user_input.get("lights", [])
+            lights_to_remove = set(user_input.get("lights", []))
             
             if lights_to_remove:
                 # Remove selected lights
                 new_data = dict(self.config_entry.data)
-                lights_config = [
-                    light for light in new_data.get(CONF_LIGHTS, [])
-                    if light["entity_id"] not in lights_to_remove
-                ]
+                lights_config = {
+                    entity_id: light_config
+                    for entity_id, light_config in new_data.get(CONF_LIGHTS, {}).items()
+                    if entity_id not in lights_to_remove
+                }
                 new_data[CONF_LIGHTS] = lights_config
                 
                 return self.async_create_entry(title="", data=new_data)
@@ -399,20 +444,16 @@ class OptionsFlow(config_entries.OptionsFlow):
             return await self.async_step_main_menu()
 
         # Get currently configured lights
-        lights_config = self.config_entry.data.get(CONF_LIGHTS, [])
+        lights_config = self.config_entry.data.get(CONF_LIGHTS, {})
         if not lights_config:
             return self.async_abort(reason="no_lights_configured")
 
         # Create options for configured lights
-        light_options = {}
-        for light_config in lights_config:
-            entity_id = light_config["entity_id"]
-            friendly_name = self._get_entity_name(entity_id)
-            light_options[entity_id] = friendly_name
+        light_options = {
+            entity_id: self._get_entity_name(entity_id) for entity_id in lights_config
+        }
 
-        data_schema = vol.Schema({
-            vol.Optional("lights"): cv.multi_select(light_options),
-        })
+        data_schema = _lights_schema(tuple(light_options.items()), required=False)
 
         return self.async_show_form(
             step_id="remove_lights",
@@ -427,10 +468,7 @@ class OptionsFlow(config_entries.OptionsFlow):
             # Update global settings
             new_data = dict(self.config_entry.data)
             new_data.update({
-                CONF_MIN_BRIGHTNESS: user_input[CONF_MIN_BRIGHTNESS],
-                CONF_MAX_BRIGHTNESS: user_input[CONF_MAX_BRIGHTNESS],
-                CONF_MIN_COLOR_TEMP: user_input[CONF_MIN_COLOR_TEMP],
-                CONF_MAX_COLOR_TEMP: user_input[CONF_MAX_COLOR_TEMP],
+                key: user_input[key] for key, _, _ in _GLOBAL_SETTINGS_FIELDS
             })
             
             return self.async_create_entry(title="", data=new_data)
@@ -439,22 +477,8 @@ class OptionsFlow(config_entries.OptionsFlow):
         current_data = self.config_entry.data
 
         data_schema = vol.Schema({
-            vol.Required(
-                CONF_MIN_BRIGHTNESS, 
-                default=current_data.get(CONF_MIN_BRIGHTNESS, DEFAULT_MIN_BRIGHTNESS)
-            ): vol.Range(min=1, max=255),
-            vol.Required(
-                CONF_MAX_BRIGHTNESS, 
-                default=current_data.get(CONF_MAX_BRIGHTNESS, DEFAULT_MAX_BRIGHTNESS)
-            ): vol.Range(min=1, max=255),
-            vol.Required(
-                CONF_MIN_COLOR_TEMP, 
-                default=current_data.get(CONF_MIN_COLOR_TEMP, DEFAULT_MIN_COLOR_TEMP)
-            ): vol.Range(min=1000, max=10000),
-            vol.Required(
-                CONF_MAX_COLOR_TEMP, 
-                default=current_data.get(CONF_MAX_COLOR_TEMP, DEFAULT_MAX_COLOR_TEMP)
-            ): vol.Range(min=1000, max=10000),
+            vol.Required(key, default=current_data.get(key, default)): validator
+            for key, default, validator in _GLOBAL_SETTINGS_FIELDS
         })
 
         return self.async_show_form(
@@ -465,30 +489,32 @@ class OptionsFlow(config_entries.OptionsFlow):
     def _get_add_lights_schema(self) -> vol.Schema:
         """Get schema for adding lights."""
         # Get available lights that aren't already configured
-        configured_lights = {
-            light["entity_id"] for light in self.config_entry.data.get(CONF_LIGHTS, [])
-        }
+        configured_lights = self.config_entry.data.get(CONF_LIGHTS, {})
         
         available_lights = {}
-        for entity in self.hass.states.async_all():
+        for entity in self.hass.states.async_all("light"):
             entity_id = entity.entity_id
-            if (entity_id.startswith("light.") and 
-                entity.state != "unavailable" and 
+            if (entity.state != "unavailable" and 
                 entity_id not in configured_lights):
                 
                 attributes = entity.attributes
-                supported_color_modes = attributes.get("supported_color_modes", [])
-                if supported_color_modes:
+                supported_color_modes = attributes.get("supported_color_modes") or ()
+                if not _BRIGHTNESS_MODES.isdisjoint(supported_color_modes):
                     friendly_name = attributes.get("friendly_name", entity_id)
                     available_lights[entity_id] = friendly_name
 
-        return vol.Schema({
-            vol.Required("lights"): cv.multi_select(available_lights),
-        })
+        return _lights_schema(tuple(available_lights.items()))
 
     def _get_entity_name(self, entity_id: str) -> str:
         """Get friendly name for an entity."""
-        state = self.hass.states.get(entity_id)
-        if state and state.attributes.get("friendly_name"):
-            return state.attributes["friendly_name"]
-        return entity_id.replace("light.", "").replace("_", " ").title()
\ No newline at end of file
+        if self._friendly_names_cache is None:
+            # Resolve the names of all configured lights in one pass; the
+            # options flow ends as soon as the light list is changed, so the
+            # cache never needs invalidating
+            self._friendly_names_cache = {
+                eid: _friendly_name(self.hass, eid)
+                for eid in self.config_entry.data.get(CONF_LIGHTS, {})
+            }
+        if (name := self._friendly_names_cache.get(entity_id)) is not None:
+            return name
+        return _friendly_name(self.hass, entity_id)
\ No newline at end of file
@@ -1,30 +1,36 @@
 """Constants for the Simplified Adaptive Lighting integration."""
+from __future__ import annotations
 
-DOMAIN = "simplified_adaptive_lighting"
+from typing import Final
+
+DOMAIN: Final = "simplified_adaptive_lighting"
 
 # Default configuration values
-DEFAULT_MIN_BRIGHTNESS = 1
-DEFAULT_MAX_BRIGHTNESS = 255
-DEFAULT_MIN_COLOR_TEMP = 2000
-DEFAULT_MAX_COLOR_TEMP = 6500
-DEFAULT_WHITE_BALANCE_OFFSET = 0
-DEFAULT_BRIGHTNESS_FACTOR = 1.0
-DEFAULT_TRANSITION_TIME = 1
+DEFAULT_MIN_BRIGHTNESS: Final = 1
+DEFAULT_MAX_BRIGHTNESS: Final = 255
+DEFAULT_MIN_COLOR_TEMP: Final = 2000
+DEFAULT_MAX_COLOR_TEMP: Final = 6500
+DEFAULT_WHITE_BALANCE_OFFSET: Final = 0
+DEFAULT_BRIGHTNESS_FACTOR: Final = 1.0
+DEFAULT_TRANSITION_TIME: Final = 1
 
 # Configuration keys
-CONF_LIGHTS = "lights"
-CONF_WHITE_BALANCE_OFFSET = "white_balance_offset"
-CONF_BRIGHTNESS_FACTOR = "brightness_factor"
-CONF_MIN_BRIGHTNESS = "min_brightness"
-CONF_MAX_BRIGHTNESS = "max_brightness"
-CONF_MIN_COLOR_TEMP = "min_color_temp"
-CONF_MAX_COLOR_TEMP = "max_color_temp"
+CONF_LIGHTS: Final = "lights"
+CONF_WHITE_BALANCE_OFFSET: Final = "white_balance_offset"
+CONF_BRIGHTNESS_FACTOR: Final = "brightness_factor"
+CONF_MIN_BRIGHTNESS: Final = "min_brightness"
+CONF_MAX_BRIGHTNESS: Final = "max_brightness"
+CONF_MIN_COLOR_TEMP: Final = "min_color_temp"
+CONF_MAX_COLOR_TEMP: Final = "max_color_temp"
+
+# Data keys
+DATA_REGISTRY: Final = "_registry"
 
 # Service names
-SERVICE_LIGHT_TURN_ON = "light.turn_on"
-SERVICE_LIGHT_TOGGLE = "light.toggle"
+SERVICE_LIGHT_TURN_ON: Final = "light.turn_on"
+SERVICE_LIGHT_TOGGLE: Final = "light.toggle"
 
 # Attributes
-ATTR_BRIGHTNESS = "brightness"
-ATTR_COLOR_TEMP_KELVIN = "color_temp_kelvin"
-ATTR_TRANSITION = "transition"
\ No newline at end of file
+ATTR_BRIGHTNESS: Final = "brightness"
+ATTR_COLOR_TEMP_KELVIN: Final = "color_temp_kelvin"
+ATTR_TRANSITION: Final = "transition"
\ No newline at end of file
@@ -15,17 +15,21 @@ from homeassistant.components.light import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Context
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
 
-from .const import DOMAIN
+from .const import CONF_LIGHTS, DATA_REGISTRY, DOMAIN
 from .manager import AdaptiveLightingManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Turn-on arguments that mean the user chose the settings themselves
+_USER_OVERRIDES = frozenset({ATTR_BRIGHTNESS, ATTR_COLOR_TEMP_KELVIN})
+
+# Target light states that make the adaptive light unavailable
+_UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,8 +47,7 @@ async def async_setup_entry(
         
         # Create adaptive light entities for each configured light
         lights = []
-        for light_config in config_data.get("lights", []):
-            entity_id = light_config["entity_id"]
+        for entity_id, light_config in config_data.get(CONF_LIGHTS, {}).items():
             
             # Validate that the target light entity exists
             target_state = hass.states.get(entity_id)
@@ -57,6 +60,10 @@ async def async_setup_entry(
                 _LOGGER.warning("Entity %s is not a light entity, skipping", entity_id)
                 continue
             
+            # Lights with invalid configuration were rejected by the manager
+            if entity_id not in manager.configured_lights_set:
+                continue
+            
             adaptive_light = AdaptiveLightEntity(
                 hass=hass,
                 config_entry=config_entry,
@@ -64,6 +71,7 @@ async def async_setup_entry(
                 target_entity_id=entity_id,
                 light_config=light_config,
                 integration_name=config_data[CONF_NAME],
+                target_state=target_state,
             )
             lights.append(adaptive_light)
             _LOGGER.debug("Created adaptive light entity for %s", entity_id)
@@ -93,6 +101,7 @@ class AdaptiveLightEntity(LightEntity):
         target_entity_id: str,
         light_config: dict[str, Any],
         integration_name: str,
+        target_state: State | None = None,
     ) -> None:
         """Initialize the adaptive light entity."""
         self.hass = hass
@@ -101,14 +110,16 @@ class AdaptiveLightEntity(LightEntity):
         self._target_entity_id = target_entity_id
         self._light_config = light_config
         
+        # Bound once for the turn-on path
+        self._calculate_settings = manager.calculate_adaptive_settings
+        
         # Generate unique entity ID and name with proper naming scheme
         target_name = target_entity_id.split(".")[-1]
         
         # Create a more descriptive unique ID
         self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{target_name}"
         
-        # Get the friendly name from the target entity if available
-        target_state = hass.states.get(target_entity_id)
+        # Get the friendly name from the target entity's state if available
         if target_state and target_state.attributes.get("friendly_name"):
             friendly_name = target_state.attributes["friendly_name"]
             self._attr_name = f"Adaptive {friendly_name}"
@@ -143,45 +154,59 @@ class AdaptiveLightEntity(LightEntity):
         self._brightness = None
         self._color_temp = None
         self._available = True
-        self._context = Context()
+        # Mirrored target values from the last update; () until the first one
+        self._target_signature: tuple[Any, ...] | None = ()
+        self._context = manager.shared_context
         self._adaptive_enabled = True  # Adaptive functionality enabled by default
-        
-        # Track target light state changes
-        self._unsub_state_listener = None
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to Home Assistant."""
         await super().async_added_to_hass()
         
-        # Start tracking the target light's state
-        self._unsub_state_listener = async_track_state_change_event(
-            self.hass,
-            [self._target_entity_id],
-            self._async_target_state_changed,
-        )
+        # Make this entity resolvable by the integration services
+        self.hass.data[DOMAIN][DATA_REGISTRY].add_entity(self)
+        
+        # Receive the target light's state changes from the manager
+        self._manager.add_entity(self)
         
         # Initialize state from target light
-        await self._async_update_from_target()
+        self._async_update_from_target(self.hass.states.get(self._target_entity_id))
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity removal from Home Assistant."""
-        if self._unsub_state_listener:
-            self._unsub_state_listener()
-            self._unsub_state_listener = None
+        self.hass.data[DOMAIN][DATA_REGISTRY].remove_entity(self)
+        self._manager.remove_entity(self)
 
     @callback
-    async def _async_target_state_changed(self, event) -> None:
-        """Handle target light state changes."""
-        await self._async_update_from_target()
-        self.async_write_ha_state()
-
-    async def _async_update_from_target(self) -> None:
-        """Update our state based on the target light's current state."""
-        target_state = self.hass.states.get(self._target_entity_id)
+    def async_handle_target_state(self, new_state: State | None) -> None:
+        """Handle a target light state change delivered by the manager."""
+        if self._async_update_from_target(new_state):
+            self.async_write_ha_state()
+
+    @callback
+    def _async_update_from_target(self, target_state: State | None) -> bool:
+        """
+        Update our state based on the target light's current state.
+        
+        Returns False without touching our state when none of the mirrored
+        values changed, e.g. for attribute-only updates of the target.
+        """
+        if target_state is None:
+            signature = None
+        else:
+            attributes = target_state.attributes
+            signature = (
+                target_state.state,
+                attributes.get(ATTR_BRIGHTNESS),
+                attributes.get(ATTR_COLOR_TEMP_KELVIN),
+            )
+        if signature == self._target_signature:
+            return False
+        self._target_signature = signature
         
-        if not target_state or target_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if not target_state or target_state.state in _UNAVAILABLE_STATES:
             self._available = False
-            return
+            return True
         
         self._available = True
         self._is_on = target_state.state == STATE_ON
@@ -199,6 +224,12 @@ class AdaptiveLightEntity(LightEntity):
         else:
             self._brightness = None
             self._color_temp = None
+        return True
+
+    @property
+    def target_entity_id(self) -> str:
+        """Return the entity ID of the wrapped target light."""
+        return self._target_entity_id
 
     @property
     def is_on(self) -> bool:
@@ -241,32 +272,23 @@ class AdaptiveLightEntity(LightEntity):
         if not self._available:
             return
 
-        # Calculate adaptive settings if not overridden by user
-        adaptive_kwargs = dict(kwargs)
-        
-        # Only apply adaptive settings if user hasn't specified them
+        # Only apply adaptive settings if user hasn't specified them; kwargs
+        # is this call's own dict, so it is filled in place
         if not self._should_skip_adaptive_settings(kwargs):
             try:
-                adaptive_settings = self._manager.calculate_adaptive_settings(self._target_entity_id)
-                
-                # Apply adaptive brightness if not specified by user
-                if ATTR_BRIGHTNESS not in kwargs:
-                    adaptive_kwargs[ATTR_BRIGHTNESS] = adaptive_settings.brightness
-                
-                # Apply adaptive color temperature if not specified by user
-                if ATTR_COLOR_TEMP_KELVIN not in kwargs:
-                    adaptive_kwargs[ATTR_COLOR_TEMP_KELVIN] = adaptive_settings.color_temp_kelvin
+                adaptive_settings = self._calculate_settings(self._target_entity_id)
+                kwargs[ATTR_BRIGHTNESS] = adaptive_settings.brightness
+                kwargs[ATTR_COLOR_TEMP_KELVIN] = adaptive_settings.color_temp_kelvin
                 
                 # Apply transition if not specified
-                if ATTR_TRANSITION not in kwargs:
-                    adaptive_kwargs[ATTR_TRANSITION] = adaptive_settings.transition
+                kwargs.setdefault(ATTR_TRANSITION, adaptive_settings.transition)
                     
             except Exception as err:
                 _LOGGER.warning("Failed to calculate adaptive settings for %s: %s", self._target_entity_id, err)
                 # Continue with original kwargs if adaptive calculation fails
 
         # Call the target light with adaptive settings
-        await self._async_call_target_service("turn_on", **adaptive_kwargs)
+        await self._async_call_target_service("turn_on", **kwargs)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the adaptive light."""
@@ -293,14 +315,15 @@ class AdaptiveLightEntity(LightEntity):
         - Adaptive functionality is disabled
         - User has explicitly provided brightness or color temperature
         """
-        return (
-            not self._adaptive_enabled or
-            ATTR_BRIGHTNESS in kwargs or 
-            ATTR_COLOR_TEMP_KELVIN in kwargs
-        )
+        return not self._adaptive_enabled or not _USER_OVERRIDES.isdisjoint(kwargs)
 
     async def _async_call_target_service(self, service: str, **kwargs: Any) -> None:
-        """Call a service on the target light entity."""
+        """
+        Call a service on the target light entity.
+        
+        The call is not blocking; our state follows the target light through
+        the manager's state change routing once the target has updated.
+        """
         service_data = {
             "entity_id": self._target_entity_id,
             **kwargs
@@ -311,7 +334,7 @@ class AdaptiveLightEntity(LightEntity):
                 "light",
                 service,
                 service_data,
-                blocking=True,
+                blocking=False,
                 context=self._context,
             )
         except Exception as err:
@@ -325,41 +348,12 @@ class AdaptiveLightEntity(LightEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        attributes = {
+        # Corrections and current adaptive values are exposed by the
+        # diagnostic sensor so they are not serialized on every state write
+        return {
             "target_entity_id": self._target_entity_id,
-            "integration": DOMAIN,
-            # HomeKit compatibility attributes
-            "homekit_compatible": True,
-            "supports_brightness": True,
-            "supports_color_temperature": True,
+            "adaptive_enabled": self._adaptive_enabled,
         }
-        
-        # Add light-specific corrections and configuration
-        corrections = self._manager.get_light_corrections(self._target_entity_id)
-        attributes.update({
-            "min_color_temp": corrections["min_color_temp"],
-            "max_color_temp": corrections["max_color_temp"],
-            "white_balance_offset": corrections["white_balance_offset"],
-            "brightness_factor": corrections["brightness_factor"],
-            "enabled": corrections["enabled"],
-        })
-        
-        # Add adaptive functionality status
-        attributes["adaptive_enabled"] = self._adaptive_enabled
-        
-        # Add current adaptive settings if available and enabled
-        if self._adaptive_enabled:
-            try:
-                adaptive_settings = self._manager.calculate_adaptive_settings(self._target_entity_id)
-                attributes.update({
-                    "adaptive_brightness": adaptive_settings.brightness,
-                    "adaptive_color_temp": adaptive_settings.color_temp_kelvin,
-                })
-            except Exception as err:
-                # Don't fail if adaptive calculation fails, but log it
-                _LOGGER.debug("Could not calculate adaptive settings for %s: %s", self._target_entity_id, err)
-        
-        return attributes
 
     @property
     def is_adaptive_enabled(self) -> bool:
@@ -1,11 +1,22 @@
 """Adaptive Lighting Manager for coordinating the integration components."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+)
+from homeassistant.util import dt as dt_util
 
 from .calculator import TimeBasedCalculator
 from .const import (
@@ -15,8 +26,60 @@ from .const import (
 )
 from .models import AdaptiveSettings, LightConfig
 
+if TYPE_CHECKING:
+    from .light import AdaptiveLightEntity
+
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds target state changes are collected before entities are updated
+_STATE_BATCH_DELAY = 0.05
+
+# Corrections reported for lights without a configuration
+_DEFAULT_CORRECTIONS: Mapping[str, Any] = MappingProxyType({
+    "min_color_temp": DEFAULT_MIN_COLOR_TEMP,
+    "max_color_temp": DEFAULT_MAX_COLOR_TEMP,
+    "white_balance_offset": 0,
+    "brightness_factor": 1.0,
+    "enabled": False,
+})
+
+
+def _build_corrector(light_config: LightConfig) -> Callable[[int, int], AdaptiveSettings]:
+    """Bind a light's range, white balance and brightness corrections into one function."""
+    min_temp = light_config.min_color_temp
+    max_temp = light_config.max_color_temp
+    white_balance_offset = light_config.white_balance_offset
+    brightness_factor = light_config.brightness_factor
+    
+    def correct(base_brightness: int, base_color_temp: int) -> AdaptiveSettings:
+        """Apply the corrections to base brightness and color temperature."""
+        color_temp = (
+            min_temp if base_color_temp < min_temp
+            else max_temp if base_color_temp > max_temp
+            else base_color_temp
+        )
+        if white_balance_offset != 0:
+            color_temp += white_balance_offset
+            color_temp = (
+                min_temp if color_temp < min_temp
+                else max_temp if color_temp > max_temp
+                else color_temp
+            )
+        
+        if brightness_factor != 1.0:
+            brightness = int(base_brightness * brightness_factor)
+            brightness = 1 if brightness < 1 else 255 if brightness > 255 else brightness
+        else:
+            brightness = base_brightness
+        
+        return AdaptiveSettings(
+            brightness=brightness,
+            color_temp_kelvin=color_temp,
+            transition=1,
+        )
+    
+    return correct
+
 
 class AdaptiveLightingManager:
     """Manages adaptive lighting for nominated lights."""
@@ -29,18 +92,154 @@ class AdaptiveLightingManager:
         self._calculator = TimeBasedCalculator(hass=hass)
         self._adaptive_enabled = True
         
+        # Entity ID of the switch controlling this manager, set once the switch is added
+        self.switch_entity_id: str | None = None
+        
+        # Context shared by the target service calls of all lights in this entry
+        self.shared_context = Context()
+        
         # Load light configurations
-        for light_data in config.get(CONF_LIGHTS, []):
-            light_config = LightConfig.from_dict(light_data)
+        for entity_id, light_data in config.get(CONF_LIGHTS, {}).items():
+            try:
+                light_config = LightConfig.from_dict(entity_id, light_data)
+            except ValueError as err:
+                _LOGGER.error("Skipping light with invalid configuration: %s", err)
+                continue
             self._lights[light_config.entity_id] = light_config
             _LOGGER.debug("Loaded light config for %s: min=%dK, max=%dK", 
                          light_config.entity_id, light_config.min_color_temp, light_config.max_color_temp)
+        
+        # Read-only corrections per light, built once since configs don't change
+        self._corrections: dict[str, Mapping[str, Any]] = {
+            entity_id: MappingProxyType({
+                "min_color_temp": light_config.min_color_temp,
+                "max_color_temp": light_config.max_color_temp,
+                "white_balance_offset": light_config.white_balance_offset,
+                "brightness_factor": light_config.brightness_factor,
+                "enabled": light_config.enabled,
+            })
+            for entity_id, light_config in self._lights.items()
+        }
+        
+        # Corrections bound per light so adaptive calculations are plain arithmetic
+        self._correctors: dict[str, Callable[[int, int], AdaptiveSettings]] = {
+            entity_id: _build_corrector(light_config)
+            for entity_id, light_config in self._lights.items()
+        }
+        
+        # Set view of the configured lights for constant-time membership checks
+        self._configured_lights_set = frozenset(self._lights)
+        self._enabled_lights_set = frozenset(
+            entity_id for entity_id, light_config in self._lights.items() if light_config.enabled
+        )
+        
+        # Base brightness and color temperature for the last few minutes,
+        # shared by every light before its own corrections are applied
+        self._base_values_cache: dict[int, tuple[int, int]] = {}
+        
+        # Adaptive settings per (light, minute), see calculate_adaptive_settings
+        self._settings_cache: dict[tuple[str, int], AdaptiveSettings] = {}
+        
+        # Adaptive light entities by target light, fed by one shared listener;
+        # weak so entities dropped on reload are not kept alive by the manager
+        self._target_to_entity: WeakValueDictionary[str, AdaptiveLightEntity] = (
+            WeakValueDictionary()
+        )
+        self._pending_states: dict[str, State | None] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._unsub_state_listener: CALLBACK_TYPE | None = None
+        
+        # Callbacks run at the start of every minute, when adaptive values change;
+        # the timer only runs while at least one callback is registered
+        self._minute_listeners: list[CALLBACK_TYPE] = []
+        self._unsub_minute_timer: CALLBACK_TYPE | None = None
     
     async def setup(self) -> bool:
         """Set up the adaptive lighting manager."""
         _LOGGER.debug("Setting up adaptive lighting manager with %d lights", len(self._lights))
+        
+        # One listener for all target lights instead of one per entity
+        if self._lights:
+            self._unsub_state_listener = async_track_state_change_event(
+                self.hass, list(self._lights), self._async_target_state_changed
+            )
         return True
     
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking target lights."""
+        if self._unsub_state_listener:
+            self._unsub_state_listener()
+            self._unsub_state_listener = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_states.clear()
+        if self._unsub_minute_timer:
+            self._unsub_minute_timer()
+            self._unsub_minute_timer = None
+        self._minute_listeners.clear()
+    
+    @callback
+    def async_add_minute_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """
+        Call update_callback at the start of every minute.
+        
+        Returns:
+            Callback that removes the listener again
+        """
+        if self._unsub_minute_timer is None:
+            self._unsub_minute_timer = async_track_time_change(
+                self.hass, self._async_minute_tick, second=0
+            )
+        self._minute_listeners.append(update_callback)
+        
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener and stop the timer once none are left."""
+            if update_callback in self._minute_listeners:
+                self._minute_listeners.remove(update_callback)
+            if not self._minute_listeners and self._unsub_minute_timer:
+                self._unsub_minute_timer()
+                self._unsub_minute_timer = None
+        
+        return remove_listener
+    
+    @callback
+    def _async_minute_tick(self, now: datetime) -> None:
+        """Notify minute listeners that adaptive values have moved on."""
+        for update_callback in list(self._minute_listeners):
+            update_callback()
+    
+    @callback
+    def add_entity(self, entity: AdaptiveLightEntity) -> None:
+        """Route state changes of the entity's target light to it."""
+        self._target_to_entity[entity.target_entity_id] = entity
+    
+    @callback
+    def remove_entity(self, entity: AdaptiveLightEntity) -> None:
+        """Stop routing target state changes to the entity."""
+        if self._target_to_entity.get(entity.target_entity_id) is entity:
+            del self._target_to_entity[entity.target_entity_id]
+    
+    @callback
+    def _async_target_state_changed(self, event: Event) -> None:
+        """Collect a target light state change for the next batched update."""
+        self._pending_states[event.data["entity_id"]] = event.data["new_state"]
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                _STATE_BATCH_DELAY, self._async_flush_target_states
+            )
+    
+    @callback
+    def _async_flush_target_states(self) -> None:
+        """Hand the latest state of each changed target light to its entity."""
+        self._flush_handle = None
+        pending, self._pending_states = self._pending_states, {}
+        for target_entity_id, new_state in pending.items():
+            if (entity := self._target_to_entity.get(target_entity_id)) is not None:
+                entity.async_handle_target_state(new_state)
+    
     def get_color_temp_for_light(self, entity_id: str, current_time: datetime | None = None) -> int:
         """
         Get color temperature for a specific light using Home Assistant sun data and per-light ranges.
@@ -53,59 +252,96 @@ class AdaptiveLightingManager:
             Color temperature in Kelvin within the light's configured range
         """
         if current_time is None:
-            current_time = datetime.now()
+            current_time = dt_util.utcnow()
         
-        # Get the light's configuration
-        light_config = self._lights.get(entity_id)
-        if not light_config:
-            _LOGGER.warning("No configuration found for light %s, using defaults", entity_id)
-            min_temp = DEFAULT_MIN_COLOR_TEMP
-            max_temp = DEFAULT_MAX_COLOR_TEMP
-        else:
-            min_temp = light_config.min_color_temp
-            max_temp = light_config.max_color_temp
+        return self._calculate_adaptive_settings(entity_id, current_time).color_temp_kelvin
+    
+    def calculate_adaptive_settings(self, entity_id: str, current_time: datetime | None = None) -> AdaptiveSettings:
+        """
+        Calculate adaptive settings for a specific light entity.
+        
+        Results are calculated for the start of the minute and cached per
+        light, so repeated reads within a minute skip the calculator.
+        """
+        if current_time is None:
+            current_time = dt_util.utcnow()
         
-        # Use the calculator with the light's specific range
-        color_temp = self._calculator.get_color_temp_kelvin(current_time)
+        key = (entity_id, int(current_time.timestamp()) // 60)
+        if (settings := self._settings_cache.get(key)) is not None:
+            return settings
         
-        # Apply the light's specific range constraints
-        constrained_temp = max(min_temp, min(max_temp, color_temp))
+        # Entries from earlier minutes are never read again; drop them all
+        # once the cache holds more than two minutes' worth
+        if len(self._settings_cache) >= 2 * max(len(self._lights), 1):
+            self._settings_cache.clear()
         
-        # Apply white balance correction if configured
-        if light_config and light_config.white_balance_offset != 0:
-            constrained_temp += light_config.white_balance_offset
-            # Re-apply range constraints after white balance correction
-            constrained_temp = max(min_temp, min(max_temp, constrained_temp))
+        settings = self._calculate_adaptive_settings(
+            entity_id, dt_util.utc_from_timestamp(key[1] * 60)
+        )
+        self._settings_cache[key] = settings
+        return settings
+    
+    def _calculate_adaptive_settings(self, entity_id: str, current_time: datetime) -> AdaptiveSettings:
+        """Calculate adaptive settings for a specific light entity at the given time."""
+        base_brightness, base_color_temp = self._get_base_values(current_time)
         
-        _LOGGER.debug("Color temp for %s: base=%dK, constrained=%dK (range: %dK-%dK)", 
-                     entity_id, color_temp, constrained_temp, min_temp, max_temp)
+        corrector = self._correctors.get(entity_id)
+        if corrector is None:
+            _LOGGER.warning("No configuration found for light %s, using defaults", entity_id)
+            return AdaptiveSettings(
+                brightness=base_brightness,
+                color_temp_kelvin=max(
+                    DEFAULT_MIN_COLOR_TEMP, min(DEFAULT_MAX_COLOR_TEMP, base_color_temp)
+                ),
+                transition=1,
+            )
         
-        return constrained_temp
+        return corrector(base_brightness, base_color_temp)
     
-    def calculate_adaptive_settings(self, entity_id: str, current_time: datetime | None = None) -> AdaptiveSettings:
-        """Calculate adaptive settings for a specific light entity."""
+    def calculate_adaptive_batch(
+        self, entity_ids: Iterable[str], current_time: datetime | None = None
+    ) -> dict[str, AdaptiveSettings]:
+        """
+        Calculate adaptive settings for several configured lights at once.
+        
+        The sun-based base values are calculated once and each light's
+        corrections are applied on top of them.
+        
+        Args:
+            entity_ids: Configured light entity IDs
+            current_time: Optional datetime to calculate for (defaults to now)
+            
+        Returns:
+            Dictionary mapping each entity ID to its adaptive settings
+        """
         if current_time is None:
-            current_time = datetime.now()
+            current_time = dt_util.utcnow()
         
-        # Get adaptive color temperature using per-light ranges
-        color_temp = self.get_color_temp_for_light(entity_id, current_time)
+        base_brightness, base_color_temp = self._get_base_values(current_time)
         
-        # Get base brightness from calculator
-        base_brightness = self._calculator.get_brightness_value(current_time)
+        correctors = self._correctors
+        return {
+            entity_id: correctors[entity_id](base_brightness, base_color_temp)
+            for entity_id in entity_ids
+        }
+    
+    def _get_base_values(self, current_time: datetime) -> tuple[int, int]:
+        """Get base brightness and color temperature for the minute of current_time."""
+        minute_bucket = int(current_time.timestamp()) // 60
+        if (base_values := self._base_values_cache.get(minute_bucket)) is not None:
+            return base_values
         
-        # Apply per-light brightness correction if configured
-        light_config = self._lights.get(entity_id)
-        if light_config and light_config.brightness_factor != 1.0:
-            corrected_brightness = int(base_brightness * light_config.brightness_factor)
-            corrected_brightness = max(1, min(255, corrected_brightness))
-        else:
-            corrected_brightness = base_brightness
+        # Only the last few minutes are ever read again
+        if len(self._base_values_cache) >= 4:
+            self._base_values_cache.clear()
         
-        return AdaptiveSettings(
-            brightness=corrected_brightness,
-            color_temp_kelvin=color_temp,
-            transition=1,
-        )
+        base_values = self._compute_base_values(minute_bucket)
+        self._base_values_cache[minute_bucket] = base_values
+        return base_values
+    
+    def _compute_base_values(self, minute_bucket: int) -> tuple[int, int]:
+        """Calculate base brightness and color temperature at the start of the given minute."""
+        return self._calculator.get_base_values(dt_util.utc_from_timestamp(minute_bucket * 60))
     
     async def enable_adaptive_lighting(self) -> None:
         """Enable adaptive lighting globally."""
@@ -127,7 +363,7 @@ class AdaptiveLightingManager:
         """Get the configuration for a specific light."""
         return self._lights.get(entity_id)
     
-    def get_light_corrections(self, entity_id: str) -> dict[str, Any]:
+    def get_light_corrections(self, entity_id: str) -> Mapping[str, Any]:
         """
         Get the corrections and configuration for a specific light.
         
@@ -135,71 +371,20 @@ class AdaptiveLightingManager:
             entity_id: The light entity ID
             
         Returns:
-            Dictionary with light configuration details
+            Read-only mapping with light configuration details
         """
-        light_config = self._lights.get(entity_id)
-        if not light_config:
-            return {
-                "min_color_temp": DEFAULT_MIN_COLOR_TEMP,
-                "max_color_temp": DEFAULT_MAX_COLOR_TEMP,
-                "white_balance_offset": 0,
-                "brightness_factor": 1.0,
-                "enabled": False,
-            }
-        
-        return {
-            "min_color_temp": light_config.min_color_temp,
-            "max_color_temp": light_config.max_color_temp,
-            "white_balance_offset": light_config.white_balance_offset,
-            "brightness_factor": light_config.brightness_factor,
-            "enabled": light_config.enabled,
-        }
+        return self._corrections.get(entity_id, _DEFAULT_CORRECTIONS)
     
     def validate_light_ranges(self) -> bool:
         """
         Validate that all configured lights have valid color temperature ranges.
         
+        Ranges are validated by LightConfig.from_dict when the lights are
+        loaded and invalid lights are skipped, so this always holds.
+        
         Returns:
-            True if all ranges are valid (min < max, reasonable bounds)
+            True
         """
-        for entity_id, light_config in self._lights.items():
-            # Check that min < max
-            if light_config.min_color_temp >= light_config.max_color_temp:
-                _LOGGER.error(
-                    "Light %s has invalid color temperature range: min=%dK >= max=%dK",
-                    entity_id, light_config.min_color_temp, light_config.max_color_temp
-                )
-                return False
-            
-            # Check reasonable bounds (1000K - 10000K)
-            if not (1000 <= light_config.min_color_temp <= 10000):
-                _LOGGER.error(
-                    "Light %s has min color temperature %dK outside reasonable range (1000K-10000K)",
-                    entity_id, light_config.min_color_temp
-                )
-                return False
-            
-            if not (1000 <= light_config.max_color_temp <= 10000):
-                _LOGGER.error(
-                    "Light %s has max color temperature %dK outside reasonable range (1000K-10000K)",
-                    entity_id, light_config.max_color_temp
-                )
-                return False
-            
-            # Check white balance offset range
-            if not (-1000 <= light_config.white_balance_offset <= 1000):
-                _LOGGER.warning(
-                    "Light %s has white balance offset %dK outside recommended range (-1000K to 1000K)",
-                    entity_id, light_config.white_balance_offset
-                )
-            
-            # Check brightness factor range
-            if not (0.1 <= light_config.brightness_factor <= 2.0):
-                _LOGGER.warning(
-                    "Light %s has brightness factor %.2f outside recommended range (0.1 to 2.0)",
-                    entity_id, light_config.brightness_factor
-                )
-        
         return True
     
     @property
@@ -207,12 +392,22 @@ class AdaptiveLightingManager:
         """Return list of configured light entity IDs."""
         return list(self._lights.keys())
     
+    @property
+    def configured_lights_set(self) -> frozenset[str]:
+        """Return the configured light entity IDs as a frozenset."""
+        return self._configured_lights_set
+    
+    @property
+    def enabled_lights_set(self) -> frozenset[str]:
+        """Return the configured light entity IDs with adaptive functionality enabled."""
+        return self._enabled_lights_set
+    
     def get_adaptive_state_summary(self) -> dict[str, Any]:
         """Get a summary of the adaptive lighting state across all entities."""
         return {
             "adaptive_enabled": self._adaptive_enabled,
             "total_lights": len(self._lights),
-            "enabled_lights": sum(1 for config in self._lights.values() if config.enabled),
+            "enabled_lights": len(self._enabled_lights_set),
             "lights": {
                 entity_id: {
                     "enabled": config.enabled,
@@ -222,4 +417,71 @@ class AdaptiveLightingManager:
                 }
                 for entity_id, config in self._lights.items()
             }
-        }
\ No newline at end of file
+        }
+
+
+@dataclass
+class AdaptiveLightingRegistry:
+    """Index of managers and adaptive light entities across all config entries."""
+    
+    _managers_by_switch: dict[str, AdaptiveLightingManager] = field(default_factory=dict)
+    _managers_by_light: dict[str, AdaptiveLightingManager] = field(default_factory=dict)
+    _entities_by_id: dict[str, AdaptiveLightEntity] = field(default_factory=dict)
+    
+    @cached_property
+    def managers_by_switch(self) -> Mapping[str, AdaptiveLightingManager]:
+        """Return a read-only view of managers keyed by switch entity ID."""
+        return MappingProxyType(dict(self._managers_by_switch))
+    
+    @cached_property
+    def managers_by_light(self) -> Mapping[str, AdaptiveLightingManager]:
+        """Return a read-only view of managers keyed by target light entity ID."""
+        return MappingProxyType(dict(self._managers_by_light))
+    
+    @cached_property
+    def entities_by_id(self) -> Mapping[str, AdaptiveLightEntity]:
+        """Return a read-only view of adaptive light entities keyed by entity ID."""
+        return MappingProxyType(dict(self._entities_by_id))
+    
+    def add_manager(self, manager: AdaptiveLightingManager) -> None:
+        """Index a manager by its configured lights."""
+        for light_entity_id in manager.configured_lights:
+            self._managers_by_light[light_entity_id] = manager
+        self._invalidate("managers_by_light")
+    
+    def remove_manager(self, manager: AdaptiveLightingManager) -> None:
+        """Remove a manager from the indexes."""
+        for light_entity_id in manager.configured_lights:
+            if self._managers_by_light.get(light_entity_id) is manager:
+                del self._managers_by_light[light_entity_id]
+        for switch_entity_id, indexed in list(self._managers_by_switch.items()):
+            if indexed is manager:
+                del self._managers_by_switch[switch_entity_id]
+        self._invalidate("managers_by_switch", "managers_by_light")
+    
+    def add_switch(self, switch_entity_id: str, manager: AdaptiveLightingManager) -> None:
+        """Index a manager by the entity ID of the switch controlling it."""
+        self._managers_by_switch[switch_entity_id] = manager
+        self._invalidate("managers_by_switch")
+    
+    def remove_switch(self, switch_entity_id: str, manager: AdaptiveLightingManager) -> None:
+        """Remove a switch from the index if it still points at the manager."""
+        if self._managers_by_switch.get(switch_entity_id) is manager:
+            del self._managers_by_switch[switch_entity_id]
+            self._invalidate("managers_by_switch")
+    
+    def add_entity(self, entity: AdaptiveLightEntity) -> None:
+        """Index an adaptive light entity by its entity ID."""
+        self._entities_by_id[entity.entity_id] = entity
+        self._invalidate("entities_by_id")
+    
+    def remove_entity(self, entity: AdaptiveLightEntity) -> None:
+        """Remove an adaptive light entity from the index."""
+        if self._entities_by_id.get(entity.entity_id) is entity:
+            del self._entities_by_id[entity.entity_id]
+            self._invalidate("entities_by_id")
+    
+    def _invalidate(self, *views: str) -> None:
+        """Drop cached views so they are rebuilt on next access."""
+        for view in views:
+            self.__dict__.pop(view, None)
@@ -1,11 +1,14 @@
 """Data models for the Simplified Adaptive Lighting integration."""
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
+_LOGGER = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LightConfig:
     """Configuration for an individual light."""
     
@@ -17,9 +20,8 @@ class LightConfig:
     enabled: bool = True
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for storage."""
+        """Convert to dictionary for storage under the light's entity ID."""
         return {
-            "entity_id": self.entity_id,
             "min_color_temp": self.min_color_temp,
             "max_color_temp": self.max_color_temp,
             "white_balance_offset": self.white_balance_offset,
@@ -28,20 +30,59 @@ class LightConfig:
         }
     
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> LightConfig:
-        """Create from dictionary."""
-        return cls(
-            entity_id=data["entity_id"],
+    def from_dict(cls, entity_id: str, data: dict[str, Any]) -> LightConfig:
+        """
+        Create from the dictionary stored under the light's entity ID.
+        
+        Raises:
+            ValueError: If the color temperature range is invalid
+        """
+        light_config = cls(
+            entity_id=entity_id,
             min_color_temp=data.get("min_color_temp", 2000),
             max_color_temp=data.get("max_color_temp", 6500),
             white_balance_offset=data.get("white_balance_offset", 0),
             brightness_factor=data.get("brightness_factor", 1.0),
             enabled=data.get("enabled", True),
         )
+        light_config._validate()
+        return light_config
+    
+    def _validate(self) -> None:
+        """Reject invalid color temperature ranges and warn about unusual corrections."""
+        if self.min_color_temp >= self.max_color_temp:
+            raise ValueError(
+                f"Light {self.entity_id} has invalid color temperature range: "
+                f"min={self.min_color_temp}K >= max={self.max_color_temp}K"
+            )
+        
+        # Check reasonable bounds (1000K - 10000K)
+        if not 1000 <= self.min_color_temp <= 10000:
+            raise ValueError(
+                f"Light {self.entity_id} has min color temperature {self.min_color_temp}K "
+                "outside reasonable range (1000K-10000K)"
+            )
+        
+        if not 1000 <= self.max_color_temp <= 10000:
+            raise ValueError(
+                f"Light {self.entity_id} has max color temperature {self.max_color_temp}K "
+                "outside reasonable range (1000K-10000K)"
+            )
+        
+        if not -1000 <= self.white_balance_offset <= 1000:
+            _LOGGER.warning(
+                "Light %s has white balance offset %dK outside recommended range (-1000K to 1000K)",
+                self.entity_id, self.white_balance_offset
+            )
+        
+        if not 0.1 <= self.brightness_factor <= 2.0:
+            _LOGGER.warning(
+                "Light %s has brightness factor %.2f outside recommended range (0.1 to 2.0)",
+                self.entity_id, self.brightness_factor
+            )
 
 
-@dataclass
-class AdaptiveSettings:
+class AdaptiveSettings(NamedTuple):
     """Adaptive lighting settings to apply to a light."""
     
     brightness: int  # 1-255
@@ -50,8 +91,4 @@ class AdaptiveSettings:
     
     def to_service_data(self) -> dict[str, Any]:
         """Convert to service call data format."""
-        return {
-            "brightness": self.brightness,
-            "color_temp_kelvin": self.color_temp_kelvin,
-            "transition": self.transition,
-        }
\ No newline at end of file
+        return self._asdict()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""Sensor platform for Simplified Adaptive Lighting integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import CONF_LIGHTS, DOMAIN
+from .manager import AdaptiveLightingManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Simplified Adaptive Lighting diagnostic sensors."""
+    _LOGGER.debug("Setting up sensor platform for entry %s", config_entry.entry_id)
+    
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    manager = entry_data["manager"]
+    config_data = entry_data["config"]
+    
+    async_add_entities(
+        AdaptiveDiagnosticSensor(
+            hass=hass,
+            config_entry=config_entry,
+            manager=manager,
+            target_entity_id=entity_id,
+            integration_name=config_data[CONF_NAME],
+        )
+        for entity_id in config_data.get(CONF_LIGHTS, {})
+        if entity_id in manager.configured_lights_set
+    )
+
+
+class AdaptiveDiagnosticSensor(SensorEntity):
+    """Diagnostic sensor exposing a light's adaptive settings and corrections."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:theme-light-dark"
+    _attr_native_unit_of_measurement = "K"
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        manager: AdaptiveLightingManager,
+        target_entity_id: str,
+        integration_name: str,
+    ) -> None:
+        """Initialize the diagnostic sensor."""
+        self.hass = hass
+        self._manager = manager
+        self._target_entity_id = target_entity_id
+        
+        target_name = target_entity_id.split(".")[-1]
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{target_name}_diagnostics"
+        self._attr_name = f"Adaptive {target_name.replace('_', ' ').title()} Diagnostics"
+        
+        # Group with the adaptive lights of the same config entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=f"Simplified Adaptive Lighting ({integration_name})",
+            manufacturer="Simplified Adaptive Lighting",
+            model="Adaptive Light Controller",
+            sw_version="0.0.2",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity added to Home Assistant."""
+        await super().async_added_to_hass()
+        
+        self._refresh_values()
+        
+        # Adaptive values change per minute; the manager pushes each new minute
+        self.async_on_remove(
+            self._manager.async_add_minute_listener(self._async_minute_update)
+        )
+
+    @callback
+    def _async_minute_update(self) -> None:
+        """Publish the adaptive settings for the new minute."""
+        self._refresh_values()
+        self.async_write_ha_state()
+
+    def _refresh_values(self) -> None:
+        """Refresh the adaptive settings and corrections for the target light."""
+        attributes: dict[str, Any] = {
+            "target_entity_id": self._target_entity_id,
+            **self._manager.get_light_corrections(self._target_entity_id),
+        }
+        
+        adaptive_settings = self._manager.calculate_adaptive_settings(self._target_entity_id)
+        attributes["adaptive_brightness"] = adaptive_settings.brightness
+        self._attr_native_value = adaptive_settings.color_temp_kelvin
+        self._attr_extra_state_attributes = attributes
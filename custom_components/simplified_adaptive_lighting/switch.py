@@ -12,7 +12,8 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from .const import CONF_LIGHTS, DATA_REGISTRY, DOMAIN
+from .light import AdaptiveLightEntity
 from .manager import AdaptiveLightingManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -86,6 +87,11 @@ class AdaptiveLightingSwitch(SwitchEntity, RestoreEntity):
         """Handle entity added to Home Assistant."""
         await super().async_added_to_hass()
         
+        # Let the manager know which switch controls it and make it resolvable
+        # by the integration services under this switch's current entity ID
+        self._manager.switch_entity_id = self.entity_id
+        self.hass.data[DOMAIN][DATA_REGISTRY].add_switch(self.entity_id, self._manager)
+        
         # Restore previous state
         if (last_state := await self.async_get_last_state()) is not None:
             self._is_on = last_state.state == "on"
@@ -109,12 +115,12 @@ class AdaptiveLightingSwitch(SwitchEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        lights_config = self._config_entry.data.get("lights", [])
+        lights_config = self._config_entry.data.get(CONF_LIGHTS, {})
         
         # Return simple, static attributes to avoid performance issues
         return {
             "adaptive_lights_count": len(lights_config),
-            "configured_lights": [light["entity_id"] for light in lights_config],
+            "configured_lights": list(lights_config),
         }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -147,6 +153,10 @@ class AdaptiveLightingSwitch(SwitchEntity, RestoreEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity removal from Home Assistant."""
+        self.hass.data[DOMAIN][DATA_REGISTRY].remove_switch(self.entity_id, self._manager)
+        if self._manager.switch_entity_id == self.entity_id:
+            self._manager.switch_entity_id = None
+        
         # Ensure adaptive lighting is properly cleaned up
         if self._is_on:
             try:
@@ -162,10 +172,7 @@ class AdaptiveLightingSwitch(SwitchEntity, RestoreEntity):
         for entity in adaptive_light_entities:
             try:
                 # Enable adaptive functionality on the entity
-                if hasattr(entity, 'async_enable_adaptive'):
-                    await entity.async_enable_adaptive()
-                elif hasattr(entity, 'set_adaptive_enabled'):
-                    entity.set_adaptive_enabled(True)
+                await entity.async_enable_adaptive()
                 _LOGGER.debug("Enabled adaptive functionality for %s", entity.entity_id)
             except Exception as err:
                 _LOGGER.warning("Failed to enable adaptive functionality for %s: %s", entity.entity_id, err)
@@ -177,15 +184,12 @@ class AdaptiveLightingSwitch(SwitchEntity, RestoreEntity):
         for entity in adaptive_light_entities:
             try:
                 # Disable adaptive functionality on the entity
-                if hasattr(entity, 'async_disable_adaptive'):
-                    await entity.async_disable_adaptive()
-                elif hasattr(entity, 'set_adaptive_enabled'):
-                    entity.set_adaptive_enabled(False)
+                await entity.async_disable_adaptive()
                 _LOGGER.debug("Disabled adaptive functionality for %s", entity.entity_id)
             except Exception as err:
                 _LOGGER.warning("Failed to disable adaptive functionality for %s: %s", entity.entity_id, err)
 
-    def _get_adaptive_light_entities(self) -> list:
+    def _get_adaptive_light_entities(self) -> list[AdaptiveLightEntity]:
         """Get all adaptive light entities for this integration."""
         # Simplified approach - just return empty list for now
         # The switch doesn't actually need to control individual light entities